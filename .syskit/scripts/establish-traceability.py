@@ -0,0 +1,651 @@
+#!/usr/bin/env python3
+"""Establish traceability links between REQ, INT, and UNIT documents.
+
+One-shot bootstrap tool from the speckit migration: fills the TBD link
+sections of freshly generated documents (REQ Interfaces / Allocated To,
+INT Referenced By / Implemented By / Used By, UNIT Implements
+Requirements / Provides / Consumes) from the literal mapping tables
+below. Only sections whose body is still "TBD" are touched, so the
+script is safe to re-run on an already-linked tree.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple, TypeVar
+
+# Worker count for the read/write phases; bounded by disk queue depth
+# rather than core count since the work is pure filesystem I/O.
+MAX_IO_WORKERS = 8
+
+_V = TypeVar("_V")
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+REQ_DIR = ROOT_DIR / "doc" / "requirements"
+INT_DIR = ROOT_DIR / "doc" / "interfaces"
+UNIT_DIR = ROOT_DIR / "doc" / "design"
+
+# Per-document content hashes from the previous run; documents whose hash
+# still matches (under the same mapping tables) are skipped entirely.
+CACHE_FILE = ROOT_DIR / ".syskit" / ".traceability-cache.json"
+
+# Mapping tables are kept sorted; emitted reference lists use table order
+# directly, so no per-document sorting happens at run time.
+
+# REQ -> interfaces it is specified against (REQ doc "Interfaces" section).
+REQ_TO_INTS: dict[str, list[str]] = {
+    "REQ-001": ["INT-010", "INT-012", "INT-013"],
+    "REQ-001.01": ["INT-001", "INT-010", "INT-012"],
+    "REQ-001.02": ["INT-010", "INT-011"],
+    "REQ-001.03": ["INT-001", "INT-012"],
+    "REQ-001.04": ["INT-010", "INT-012", "INT-013"],
+    "REQ-001.05": ["INT-010"],
+    "REQ-001.06": ["INT-013"],
+    "REQ-002": ["INT-010", "INT-011"],
+    "REQ-002.01": [],
+    "REQ-002.02": ["INT-010"],
+    "REQ-002.03": ["INT-010", "INT-011"],
+    "REQ-003": ["INT-010", "INT-014"],
+    "REQ-003.01": ["INT-010", "INT-011", "INT-014"],
+    "REQ-003.02": ["INT-010", "INT-014"],
+    "REQ-003.05": ["INT-010", "INT-014"],
+    "REQ-003.06": ["INT-010", "INT-011", "INT-014"],
+    "REQ-003.08": ["INT-010", "INT-014"],
+    "REQ-003.09": ["INT-010", "INT-014"],
+    "REQ-004": ["INT-010"],
+    "REQ-004.01": ["INT-010"],
+    "REQ-004.02": ["INT-010"],
+    "REQ-005": ["INT-010", "INT-011"],
+    "REQ-005.01": ["INT-010", "INT-011"],
+    "REQ-005.02": ["INT-010", "INT-011"],
+    "REQ-005.03": ["INT-010", "INT-011"],
+    "REQ-005.04": ["INT-010", "INT-011"],
+    "REQ-005.06": ["INT-010", "INT-011"],
+    "REQ-005.07": ["INT-010", "INT-011"],
+    "REQ-005.08": ["INT-010", "INT-011"],
+    "REQ-005.09": ["INT-010", "INT-011"],
+    "REQ-005.10": ["INT-010"],
+    "REQ-006": ["INT-002", "INT-010", "INT-011"],
+    "REQ-006.01": ["INT-002", "INT-010", "INT-011"],
+    "REQ-006.02": ["INT-002", "INT-010", "INT-011"],
+    "REQ-006.03": ["INT-010", "INT-011"],
+    "REQ-011": [],
+    "REQ-011.01": ["INT-010", "INT-011"],
+    "REQ-011.02": ["INT-010", "INT-011"],
+    "REQ-011.03": ["INT-010", "INT-013"],
+    "REQ-013": [],
+    "REQ-013.01": ["INT-010", "INT-012"],
+    "REQ-013.02": ["INT-010", "INT-011", "INT-014"],
+    "REQ-013.03": ["INT-013"],
+}
+
+# REQ -> design units it is allocated to (REQ doc "Allocated To" section).
+REQ_TO_UNITS: dict[str, list[str]] = {
+    "REQ-001": ["UNIT-001", "UNIT-002", "UNIT-003"],
+    "REQ-001.01": ["UNIT-001", "UNIT-002", "UNIT-003"],
+    "REQ-001.02": ["UNIT-003", "UNIT-007"],
+    "REQ-001.03": ["UNIT-001"],
+    "REQ-001.04": ["UNIT-002"],
+    "REQ-001.05": ["UNIT-003"],
+    "REQ-002": ["UNIT-005", "UNIT-007"],
+    "REQ-002.02": ["UNIT-005", "UNIT-005.04", "UNIT-006"],
+    "REQ-002.03": [
+        "UNIT-005",
+        "UNIT-005.01",
+        "UNIT-005.02",
+        "UNIT-005.03",
+        "UNIT-005.04",
+        "UNIT-005.05",
+    ],
+    "REQ-003": ["UNIT-011"],
+    "REQ-003.01": ["UNIT-005", "UNIT-005.04", "UNIT-011"],
+    "REQ-003.02": ["UNIT-010", "UNIT-011"],
+    "REQ-003.05": ["UNIT-011", "UNIT-011.01"],
+    "REQ-003.06": ["UNIT-011", "UNIT-011.06"],
+    "REQ-003.08": ["UNIT-011", "UNIT-011.03", "UNIT-011.06"],
+    "REQ-003.09": ["UNIT-003"],
+    "REQ-004": ["UNIT-006", "UNIT-010"],
+    "REQ-004.01": ["UNIT-006", "UNIT-010"],
+    "REQ-004.02": ["UNIT-005", "UNIT-005.04", "UNIT-006", "UNIT-010"],
+    "REQ-005": ["UNIT-006", "UNIT-007", "UNIT-008"],
+    "REQ-005.01": ["UNIT-006", "UNIT-007", "UNIT-008", "UNIT-013"],
+    "REQ-005.02": ["UNIT-005", "UNIT-005.04", "UNIT-006", "UNIT-007"],
+    "REQ-005.03": ["UNIT-006", "UNIT-010", "UNIT-013"],
+    "REQ-005.04": ["UNIT-005", "UNIT-006", "UNIT-007"],
+    "REQ-005.06": ["UNIT-006", "UNIT-007", "UNIT-008", "UNIT-013"],
+    "REQ-005.07": [
+        "UNIT-005",
+        "UNIT-005.06",
+        "UNIT-006",
+        "UNIT-007",
+        "UNIT-012",
+    ],
+    "REQ-005.08": ["UNIT-005.06", "UNIT-007", "UNIT-012", "UNIT-013"],
+    "REQ-005.09": ["UNIT-006", "UNIT-008", "UNIT-013"],
+    "REQ-005.10": ["UNIT-006"],
+    "REQ-006": ["UNIT-008", "UNIT-009"],
+    "REQ-006.01": ["UNIT-008", "UNIT-009"],
+    "REQ-006.02": ["UNIT-008", "UNIT-009"],
+    "REQ-006.03": ["UNIT-008"],
+    "REQ-011.01": ["UNIT-005", "UNIT-006", "UNIT-007", "UNIT-008"],
+    "REQ-011.02": [
+        "UNIT-001",
+        "UNIT-002",
+        "UNIT-003",
+        "UNIT-005",
+        "UNIT-005.06",
+        "UNIT-006",
+        "UNIT-007",
+        "UNIT-009",
+        "UNIT-010",
+        "UNIT-012",
+        "UNIT-013",
+    ],
+    "REQ-011.03": ["UNIT-001"],
+}
+
+
+class UnitInts(NamedTuple):
+    """Interfaces a design unit provides and consumes."""
+
+    provides: tuple[str, ...]
+    consumes: tuple[str, ...]
+
+
+# UNIT -> interfaces it provides / consumes (UNIT doc "Interfaces" section).
+UNIT_TO_INTS: dict[str, UnitInts] = {
+    "UNIT-001": UnitInts(("INT-001",), ("INT-001", "INT-010", "INT-012")),
+    "UNIT-002": UnitInts((), ("INT-012",)),
+    "UNIT-003": UnitInts(("INT-010",), ()),
+    "UNIT-005": UnitInts((), ("INT-010", "INT-011")),
+    "UNIT-005.01": UnitInts((), ()),
+    "UNIT-005.02": UnitInts((), ()),
+    "UNIT-005.03": UnitInts((), ()),
+    "UNIT-005.04": UnitInts((), ()),
+    "UNIT-005.05": UnitInts((), ()),
+    "UNIT-005.06": UnitInts((), ()),
+    "UNIT-006": UnitInts((), ("INT-010", "INT-011")),
+    "UNIT-007": UnitInts((), ("INT-011",)),
+    "UNIT-008": UnitInts(("INT-002",), ("INT-010", "INT-011")),
+    "UNIT-009": UnitInts(("INT-002",), ("INT-002",)),
+    "UNIT-010": UnitInts((), ("INT-010",)),
+    "UNIT-011": UnitInts((), ("INT-010", "INT-011", "INT-014")),
+    "UNIT-011.01": UnitInts((), ("INT-010",)),
+    "UNIT-011.03": UnitInts((), ("INT-010",)),
+    "UNIT-011.06": UnitInts((), ("INT-010", "INT-011", "INT-014")),
+    "UNIT-012": UnitInts((), ("INT-011",)),
+    "UNIT-013": UnitInts((), ("INT-011",)),
+}
+
+
+def _intern_keys(mapping: dict[str, _V]) -> dict[str, _V]:
+    """Re-key a table on interned strings so lookups compare by identity."""
+    return {sys.intern(k): v for k, v in mapping.items()}
+
+
+def _invert(mapping: dict[str, list[str]]) -> dict[str, tuple[str, ...]]:
+    """Invert a one-to-many mapping, sorting values for deterministic output."""
+    inverted: dict[str, list[str]] = defaultdict(list)
+    for key, values in mapping.items():
+        for value in values:
+            inverted[value].append(key)
+    return {sys.intern(k): tuple(sorted(v)) for k, v in inverted.items()}
+
+
+def _invert_unit_ints() -> dict[str, dict[str, tuple[str, ...]]]:
+    """Invert UNIT_TO_INTS into INT -> provider / consumer unit lists."""
+    inverted: dict[str, dict[str, list[str]]] = {}
+    for unit_id, ints in UNIT_TO_INTS.items():
+        for int_id in ints.provides:
+            entry = inverted.setdefault(
+                int_id, {"providers": [], "consumers": []}
+            )
+            entry["providers"].append(unit_id)
+        for int_id in ints.consumes:
+            entry = inverted.setdefault(
+                int_id, {"providers": [], "consumers": []}
+            )
+            entry["consumers"].append(unit_id)
+    return {
+        int_id: {
+            "providers": tuple(sorted(entry["providers"])),
+            "consumers": tuple(sorted(entry["consumers"])),
+        }
+        for int_id, entry in inverted.items()
+    }
+
+
+# Intern table keys: doc IDs are short strings compared thousands of times
+# during the run, and interning lets dict lookups short-circuit on identity.
+REQ_TO_INTS = _intern_keys(REQ_TO_INTS)
+REQ_TO_UNITS = _intern_keys(REQ_TO_UNITS)
+UNIT_TO_INTS = _intern_keys(UNIT_TO_INTS)
+
+# Reverse maps, computed once at import since the source tables are literals.
+INT_TO_REQS: dict[str, tuple[str, ...]] = _invert(REQ_TO_INTS)
+UNIT_TO_REQS: dict[str, tuple[str, ...]] = _invert(REQ_TO_UNITS)
+INT_TO_UNITS: dict[str, dict[str, tuple[str, ...]]] = _invert_unit_ints()
+
+
+def _digest(text: str) -> str:
+    """Return a short stable content hash for the skip cache."""
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _tables_digest() -> str:
+    """Hash the literal mapping tables; a change invalidates the whole cache."""
+    return _digest(repr((REQ_TO_INTS, REQ_TO_UNITS, UNIT_TO_INTS)))
+
+
+def load_cache() -> dict[str, str]:
+    """Load per-document hashes from the previous run, if still valid."""
+    try:
+        cache = json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if cache.get("tables") != _tables_digest():
+        return {}
+    docs = cache.get("docs", {})
+    return docs if isinstance(docs, dict) else {}
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """Write text to path atomically (temp file + rename).
+
+    A crash mid-run can then never leave a half-written document behind,
+    which also keeps the skip cache trustworthy across interrupted runs.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def save_cache(doc_hashes: dict[str, str]) -> None:
+    """Persist per-document hashes for the next run's skip check."""
+    atomic_write(
+        CACHE_FILE,
+        json.dumps({"tables": _tables_digest(), "docs": doc_hashes}, indent=1),
+    )
+
+
+DOC_ID_RE = re.compile(r"(req|int|unit)_([\d.]+)")
+TITLE_RE = re.compile(r"^#\s+[A-Z]+-[\d.]+:\s+(.+)$", re.MULTILINE)
+PROV_CONS_RE = re.compile(r"(###\s+(Provides|Consumes)\s*\n\n)TBD[^\n]*")
+
+# A parsed document: preamble text plus "## " section name -> raw body.
+Sections = dict[str, str]
+ParsedDoc = tuple[str, Sections]
+
+
+def parse_sections(content: str) -> ParsedDoc:
+    """Split a document into its preamble and "## " sections.
+
+    Section bodies keep their surrounding blank lines verbatim, so
+    serialize_sections(*parse_sections(content)) == content for documents
+    with unique, canonically spelled "## name" headings. Duplicate
+    section names collapse in the dict (last body wins) and heading
+    whitespace is normalized, so callers that rewrite documents must
+    verify the round-trip first and leave non-round-tripping documents
+    untouched (main() does exactly that).
+    """
+    preamble_lines: list[str] = []
+    sections: Sections = {}
+    current: list[str] | None = preamble_lines
+    name = ""
+    for line in content.splitlines(keepends=True):
+        if line.startswith("## "):
+            if current is preamble_lines:
+                preamble = "".join(preamble_lines)
+            else:
+                sections[name] = "".join(current)
+            name = line[3:].rstrip("\n").strip()
+            current = []
+        else:
+            current.append(line)
+    if current is preamble_lines:
+        return "".join(preamble_lines), sections
+    sections[name] = "".join(current)
+    return preamble, sections
+
+
+def serialize_sections(preamble: str, sections: Sections) -> str:
+    """Reassemble a document from its preamble and section dict."""
+    parts = [preamble]
+    for name, body in sections.items():
+        parts.append(f"## {name}\n")
+        parts.append(body)
+    return "".join(parts)
+
+
+def find_all_docs(doc_dir: Path, prefix: str) -> list[Path]:
+    """Return all numbered documents in doc_dir, excluding the template.
+
+    Uses os.scandir directly: one directory read, no per-entry stat or
+    fnmatch work as with Path.glob.
+    """
+    marker = f"{prefix}_"
+    template = f"{prefix}_000_template"
+    with os.scandir(doc_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith(marker)
+            and entry.name.endswith(".md")
+            and not entry.name.startswith(template)
+        )
+
+
+@lru_cache(maxsize=None)
+def extract_doc_id(path: Path) -> str | None:
+    """Extract a document ID like "REQ-001.02" from a filename.
+
+    Called once per document per establish pass, so the result is memoized
+    on the (hashable) path.
+    """
+    m = DOC_ID_RE.match(path.name)
+    if not m:
+        return None
+    return sys.intern(f"{m.group(1).upper()}-{m.group(2).rstrip('.')}")
+
+
+# The title heading is the first line of every templated document; cap the
+# scan so a malformed large doc cannot drag the title pass over its whole body.
+TITLE_SCAN_LIMIT = 1024
+
+
+def extract_title_from_content(content: str) -> str:
+    """Extract the document title from its top-level heading."""
+    m = TITLE_RE.search(content, 0, TITLE_SCAN_LIMIT)
+    return m.group(1).strip() if m else "Unknown"
+
+
+@lru_cache(maxsize=None)
+def _format_ref(item: str, title: str) -> str:
+    """Format one reference bullet; memoized since the same ID and title
+    pair is emitted in many documents across a run."""
+    return f"- {item} ({title})"
+
+
+def _format_refs(items: Sequence[str], titles: Mapping[str, str]) -> str:
+    """Format a reference list as markdown bullets, empty string if none."""
+    return "\n".join(_format_ref(i, titles.get(i, "Unknown")) for i in items)
+
+
+def replace_tbd_section(
+    sections: Sections, section_name: str, new_content: str
+) -> None:
+    """Replace the TBD body of a "## section_name" section, if present.
+
+    Section bodies are templated as a blank line followed by a TBD line,
+    so a startswith test plus slice replaces the former anchored regex.
+    """
+    body = sections.get(section_name)
+    if body is None or not body.startswith("\nTBD"):
+        return
+    end = body.find("\n", 1)
+    rest = body[end:] if end >= 0 else ""
+    sections[section_name] = "\n" + new_content + rest
+
+
+def replace_interfaces(
+    sections: Sections, ints: Sequence[str], int_titles: Mapping[str, str]
+) -> None:
+    """Fill the "Interfaces" section of a REQ document."""
+    replace_tbd_section(
+        sections, "Interfaces", _format_refs(ints, int_titles) or "None"
+    )
+
+
+def replace_allocated_to(
+    sections: Sections, units: Sequence[str], unit_titles: Mapping[str, str]
+) -> None:
+    """Fill the "Allocated To" section of a REQ document."""
+    replace_tbd_section(
+        sections, "Allocated To", _format_refs(units, unit_titles) or "None"
+    )
+
+
+def replace_referenced_by(
+    sections: Sections, reqs: Sequence[str], req_titles: Mapping[str, str]
+) -> None:
+    """Fill the "Referenced By" section of an INT document."""
+    replace_tbd_section(
+        sections, "Referenced By", _format_refs(reqs, req_titles) or "None"
+    )
+
+
+def replace_implements_requirements(
+    sections: Sections, reqs: Sequence[str], req_titles: Mapping[str, str]
+) -> None:
+    """Fill the "Implements Requirements" section of a UNIT document."""
+    replace_tbd_section(
+        sections,
+        "Implements Requirements",
+        _format_refs(reqs, req_titles) or "None",
+    )
+
+
+def replace_unit_interfaces(
+    sections: Sections, provides_text: str, consumes_text: str
+) -> None:
+    """Fill the "Provides" / "Consumes" sub-sections of a UNIT document.
+
+    Both live under "## Interfaces", so only that section body is scanned,
+    and one fused pattern patches both sub-sections in a single traversal.
+    """
+    body = sections.get("Interfaces")
+    if body is None:
+        return
+    updated = _patch_subsection(body, "Provides", provides_text) or body
+    updated = _patch_subsection(updated, "Consumes", consumes_text) or updated
+    if "TBD" in updated:
+        # Non-canonical heading spacing; fall back to the tolerant regex.
+        updated = _patch_subsections_regex(updated, provides_text, consumes_text)
+    if updated != body:
+        sections["Interfaces"] = updated
+
+
+def _patch_subsection(body: str, heading: str, new_content: str) -> str:
+    """Patch a templated "### heading\\n\\nTBD" line via str.partition.
+
+    Returns the patched body, or "" when the canonical form is absent.
+    """
+    anchor = f"### {heading}\n\nTBD"
+    head, sep, tail = body.partition(anchor)
+    if not sep:
+        return ""
+    newline = tail.find("\n")
+    rest = tail[newline:] if newline >= 0 else ""
+    return f"{head}### {heading}\n\n{new_content}{rest}"
+
+
+def _patch_subsections_regex(
+    body: str, provides_text: str, consumes_text: str
+) -> str:
+    """Regex fallback for Provides/Consumes bodies with unusual spacing."""
+    parts: list[str] = []
+    pos = 0
+    for m in PROV_CONS_RE.finditer(body):
+        parts.append(body[pos : m.start()])
+        parts.append(m.group(1))
+        parts.append(
+            provides_text if m.group(2) == "Provides" else consumes_text
+        )
+        pos = m.end()
+    if not parts:
+        return body
+    parts.append(body[pos:])
+    return "".join(parts)
+
+
+def process_req(
+    doc_id: str,
+    sections: Sections,
+    int_titles: Mapping[str, str],
+    unit_titles: Mapping[str, str],
+) -> None:
+    """Apply both REQ link types (Interfaces, Allocated To) to one document."""
+    if doc_id in REQ_TO_INTS:
+        replace_interfaces(sections, REQ_TO_INTS[doc_id], int_titles)
+    if doc_id in REQ_TO_UNITS:
+        replace_allocated_to(sections, REQ_TO_UNITS[doc_id], unit_titles)
+
+
+def process_int(
+    doc_id: str,
+    sections: Sections,
+    req_titles: Mapping[str, str],
+    unit_titles: Mapping[str, str],
+) -> None:
+    """Apply both INT link types (Referenced By, Implemented By / Used By)."""
+    replace_referenced_by(sections, INT_TO_REQS.get(doc_id, []), req_titles)
+
+    entry = INT_TO_UNITS.get(doc_id, {"providers": (), "consumers": ()})
+    providers = _format_refs(entry["providers"], unit_titles)
+    consumers = _format_refs(entry["consumers"], unit_titles)
+    replace_tbd_section(sections, "Implemented By", providers or "None")
+    replace_tbd_section(sections, "Used By", consumers or "None")
+
+
+def process_unit(
+    doc_id: str,
+    sections: Sections,
+    req_titles: Mapping[str, str],
+    int_titles: Mapping[str, str],
+) -> None:
+    """Apply both UNIT link types (Implements Requirements, Provides / Consumes)."""
+    replace_implements_requirements(
+        sections, UNIT_TO_REQS.get(doc_id, []), req_titles
+    )
+
+    if doc_id not in UNIT_TO_INTS:
+        return
+    ints = UNIT_TO_INTS[doc_id]
+    provides = _format_refs(ints.provides, int_titles)
+    consumes = _format_refs(ints.consumes, int_titles)
+    replace_unit_interfaces(sections, provides or "None", consumes or "None")
+
+
+def main() -> int:
+    """Load and parse all documents once, apply the link passes, write changes."""
+    req_docs = find_all_docs(REQ_DIR, "req")
+    int_docs = find_all_docs(INT_DIR, "int")
+    unit_docs = find_all_docs(UNIT_DIR, "unit")
+
+    # Read and parse each document exactly once; all passes mutate the
+    # parsed section dicts in place. Reads overlap in a thread pool since
+    # the GIL is released during filesystem calls; the passes themselves
+    # stay single-threaded (they are cheap in-memory dict mutation).
+    all_docs = req_docs + int_docs + unit_docs
+    with ThreadPoolExecutor(max_workers=MAX_IO_WORKERS) as executor:
+        contents: dict[Path, str] = dict(
+            zip(all_docs, executor.map(Path.read_text, all_docs))
+        )
+
+    # Skip documents whose content hash matches the previous run under the
+    # same mapping tables: the passes would be a guaranteed no-op on them.
+    cached = load_cache()
+    doc_hashes = {
+        str(p.relative_to(ROOT_DIR)): _digest(c) for p, c in contents.items()
+    }
+    fresh = {
+        p
+        for p in all_docs
+        if cached.get(str(p.relative_to(ROOT_DIR)))
+        == doc_hashes[str(p.relative_to(ROOT_DIR))]
+    }
+    req_docs = [p for p in req_docs if p not in fresh]
+    int_docs = [p for p in int_docs if p not in fresh]
+    unit_docs = [p for p in unit_docs if p not in fresh]
+
+    # Only round-trippable documents may be rewritten: the section dict
+    # collapses duplicate headings and normalizes heading whitespace, so
+    # serializing a document that fails the identity check would lose
+    # content. Such documents are skipped (and kept out of the cache so
+    # the warning repeats until they are fixed).
+    parsed: dict[Path, ParsedDoc] = {}
+    skipped: list[Path] = []
+    for p in req_docs + int_docs + unit_docs:
+        doc = parse_sections(contents[p])
+        if serialize_sections(*doc) != contents[p]:
+            skipped.append(p)
+            print(
+                f"  warning: {p.relative_to(ROOT_DIR)} has duplicate or "
+                f"non-canonical '## ' headings; left untouched"
+            )
+            continue
+        parsed[p] = doc
+
+    # Titles come from every document (including skipped ones), since any
+    # processed document may reference them.
+    req_titles = MappingProxyType(
+        {
+            extract_doc_id(p): extract_title_from_content(contents[p])
+            for p in all_docs
+            if p.name.startswith("req_")
+        }
+    )
+    int_titles = MappingProxyType(
+        {
+            extract_doc_id(p): extract_title_from_content(contents[p])
+            for p in all_docs
+            if p.name.startswith("int_")
+        }
+    )
+    unit_titles = MappingProxyType(
+        {
+            extract_doc_id(p): extract_title_from_content(contents[p])
+            for p in all_docs
+            if p.name.startswith("unit_")
+        }
+    )
+
+    # The six link types form a DAG over (document kind, section) writes:
+    # both REQ link types touch only REQ docs, both INT types only INT
+    # docs, both UNIT types only UNIT docs. Dispatching on kind is
+    # therefore a valid topological order in which every document reaches
+    # its final content in one visit, preserving the one-read / at-most-
+    # one-write bound per document.
+    processors = {
+        "req": (process_req, int_titles, unit_titles),
+        "int": (process_int, req_titles, unit_titles),
+        "unit": (process_unit, req_titles, int_titles),
+    }
+    for doc in parsed:
+        doc_id = extract_doc_id(doc)
+        if doc_id is None:
+            continue
+        process, titles_a, titles_b = processors[doc.name.split("_", 1)[0]]
+        process(doc_id, parsed[doc][1], titles_a, titles_b)
+
+    to_write = [
+        (path, serialized)
+        for path, doc in parsed.items()
+        if (serialized := serialize_sections(*doc)) != contents[path]
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_IO_WORKERS) as executor:
+        list(executor.map(lambda item: atomic_write(*item), to_write))
+    for path, serialized in to_write:
+        print(f"  updated {path.relative_to(ROOT_DIR)}")
+        doc_hashes[str(path.relative_to(ROOT_DIR))] = _digest(serialized)
+    for path in skipped:
+        doc_hashes.pop(str(path.relative_to(ROOT_DIR)), None)
+    save_cache(doc_hashes)
+
+    print(
+        f"Traceability: {len(contents)} documents scanned, "
+        f"{len(fresh)} unchanged since last run, {len(to_write)} updated"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""Migrate speckit feature specifications into syskit documents.
+
+One-shot migration tool: reads the legacy speckit tree (specs/<feature>/
+spec.md, contracts/*.md, research.md) and generates syskit REQ, INT, and
+UNIT documents plus design-decision records. Existing documents are
+never overwritten, so the script is safe to re-run against a partially
+migrated tree. Kept for reference and for re-runs against archived
+speckit trees; it exits cleanly when the legacy specs/ directory is
+absent.
+"""
+
+import os
+import re
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+# Output files are written concurrently; writes release the GIL, so a
+# thread pool overlaps their latency.
+MAX_IO_WORKERS = 16
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SPECS_DIR = ROOT_DIR / "specs"
+REQ_DIR = ROOT_DIR / "doc" / "requirements"
+INT_DIR = ROOT_DIR / "doc" / "interfaces"
+UNIT_DIR = ROOT_DIR / "doc" / "design"
+DESIGN_DECISIONS = UNIT_DIR / "design_decisions.md"
+
+# Root prefix for rendering repo-relative paths in generated text; a
+# removeprefix slice is cheaper than Path.relative_to part-walking.
+_ROOT_STR = str(ROOT_DIR) + os.sep
+
+# Feature key -> user story ID -> target requirement ID.
+US_TO_REQ: dict[str, dict[str, str]] = {
+    "001-gpu-spi-hardware": {
+        "US-001": "REQ-001.01",
+        "US-002": "REQ-001.02",
+        "US-003": "REQ-001.03",
+        "US-004": "REQ-001.04",
+        "US-005": "REQ-001.05",
+        "US-006": "REQ-001.06",
+    },
+    "002-triangle-rasterizer": {
+        "US-001": "REQ-002.01",
+        "US-002": "REQ-002.02",
+        "US-003": "REQ-002.03",
+    },
+    "003-texture-mapping": {
+        "US-001": "REQ-003.01",
+        "US-002": "REQ-003.02",
+        "US-005": "REQ-003.05",
+        "US-006": "REQ-003.06",
+        "US-008": "REQ-003.08",
+        "US-009": "REQ-003.09",
+    },
+    "004-fragment-processing": {
+        "US-001": "REQ-004.01",
+        "US-002": "REQ-004.02",
+    },
+    "005-framebuffer-blend": {
+        "US-001": "REQ-005.01",
+        "US-002": "REQ-005.02",
+        "US-003": "REQ-005.03",
+        "US-004": "REQ-005.04",
+        "US-006": "REQ-005.06",
+        "US-007": "REQ-005.07",
+        "US-008": "REQ-005.08",
+        "US-009": "REQ-005.09",
+        "US-010": "REQ-005.10",
+    },
+    "006-display-output": {
+        "US-001": "REQ-006.01",
+        "US-002": "REQ-006.02",
+        "US-003": "REQ-006.03",
+    },
+    "013-host-spi-driver": {
+        "US-001": "REQ-013.01",
+        "US-002": "REQ-013.02",
+        "US-003": "REQ-013.03",
+    },
+}
+
+# Contract filename stem -> (interface ID, interface title).
+CONTRACT_TO_INT: dict[str, tuple[str, str]] = {
+    "register-map": ("INT-010", "GPU Register Map"),
+    "sram-layout": ("INT-011", "SRAM Memory Layout"),
+    "spi-transactions": ("INT-012", "SPI Transaction Format"),
+    "gpio-status": ("INT-013", "GPIO Status Signals"),
+    "texture-layout": ("INT-014", "Texture Memory Layout"),
+}
+
+# External standards referenced by the specs but not defined by a contract.
+EXTERNAL_INTS: list[tuple[str, str, str]] = [
+    ("INT-001", "SPI Mode 0 Protocol", "SPI Mode 0 (CPOL=0, CPHA=0)"),
+    ("INT-002", "DVI TMDS Output", "DVI 1.0 TMDS encoding, 640x480@60"),
+]
+
+# Legacy module spec name -> (unit ID, unit title).
+MODULE_TO_UNIT: dict[str, tuple[str, str]] = {
+    "spi_slave": ("UNIT-001", "SPI Slave Controller"),
+    "command_fifo": ("UNIT-002", "Command FIFO"),
+    "register_file": ("UNIT-003", "Register File"),
+    "rasterizer": ("UNIT-005", "Rasterizer"),
+    "pixel_pipeline": ("UNIT-006", "Pixel Pipeline"),
+    "sram_arbiter": ("UNIT-007", "SRAM Arbiter"),
+    "display_controller": ("UNIT-008", "Display Controller"),
+    "dvi_encoder": ("UNIT-009", "DVI TMDS Encoder"),
+    "color_combiner": ("UNIT-010", "Color Combiner"),
+    "texture_sampler": ("UNIT-011", "Texture Sampler"),
+}
+
+# Compiled once at module scope: these run per story / per document in
+# the extraction loops.
+# Values stop at the next field key even mid-line, so inline stories
+# ("**As a** x, **I want** y, **so that** z") tokenize field by field.
+_BODY_FIELDS_RE = re.compile(
+    r"\*\*(As a|I want|So that|Priority:|Acceptance Criteria:)\*\*"
+    r"\s*(.+?)"
+    r"(?=\n\*\*|\*\*(?:As a|I want|So that|Priority|Acceptance Criteria)|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+_FR_RE = re.compile(r"^-\s+\*\*(FR-\d+)\*\*:\s*(.+)$", re.MULTILINE)
+_NONALNUM_RE = re.compile(r"[^a-zA-Z0-9\s]")
+_WS_RE = re.compile(r"\s+")
+_DECISION_RE = re.compile(
+    r"^##\s+Decision:\s*(.+?)\n(.+?)(?=^##\s+|\Z)", re.DOTALL | re.MULTILINE
+)
+
+
+@lru_cache(maxsize=256)
+def _slurp_bytes(path: Path) -> bytes:
+    """Read a source file as one buffered binary read, memoized per path.
+
+    ASCII-structured scans work directly on the bytes; decode only what
+    gets extracted. Only read-only inputs go through this helper —
+    files that are written after being read (the design-decisions log)
+    must bypass the cache.
+    """
+    with open(path, "rb", buffering=1 << 20) as f:
+        return f.read()
+
+
+@lru_cache(maxsize=256)
+def _slurp(path: Path) -> str:
+    """Return the decoded text of a source file, memoized per path."""
+    return _slurp_bytes(path).decode("utf-8")
+
+
+@lru_cache(maxsize=64)
+def _section_re(section_name: str) -> re.Pattern[str]:
+    """Return the compiled body pattern for a "## section_name" heading."""
+    return re.compile(
+        rf"##\s+{re.escape(section_name)}\s*\n\n(.+?)(?=\n##\s|\Z)", re.DOTALL
+    )
+
+
+@lru_cache(maxsize=1024)
+def snake_case(title: str) -> str:
+    """Convert a document title to a snake_case filename fragment.
+
+    Pure function called once per output file, with recurring titles
+    across stages, so the result is memoized.
+    """
+    cleaned = _NONALNUM_RE.sub("", title)
+    return _WS_RE.sub("_", cleaned.strip()).lower()
+
+
+def extract_section(content: str, section_name: str) -> str:
+    """Return the body of a "## section_name" section, or "" if absent."""
+    marker = f"## {section_name}\n"
+    idx = content.find(marker)
+    if idx < 0:
+        # Cheap reject: the regex cannot match if the name never
+        # appears. The tolerant pattern only runs for unusual heading
+        # spacing.
+        if section_name not in content:
+            return ""
+        m = _section_re(section_name).search(content)
+        return m.group(1).strip() if m else ""
+    if idx > 0 and content[idx - 1] != "\n":
+        # "### section_name" or mid-line hit; defer to the anchored regex.
+        m = _section_re(section_name).search(content)
+        return m.group(1).strip() if m else ""
+    tail = content[idx + len(marker):]
+    end = tail.find("\n## ")
+    body = tail[:end] if end >= 0 else tail
+    return body.strip()
+
+
+def extract_user_stories(
+    spec_file: Path, feature_key: str
+) -> list[dict[str, str]]:
+    """Extract the mapped user stories from a feature spec.
+
+    # Arguments
+    spec_file: the feature's spec.md.
+    feature_key: key into US_TO_REQ selecting which stories to migrate.
+
+    # Returns
+    One dict per mapped story with id, req_id, title, and body fields.
+    """
+    content = _slurp_bytes(spec_file)
+    wanted = US_TO_REQ[feature_key]
+    stories: list[dict[str, str]] = []
+    # Slice the spec at heading lines while it is still bytes — the
+    # markers are pure ASCII — and decode only the chunks that are
+    # actually extracted. Stories are the "### US-NNN:" chunks, ending
+    # at the next heading.
+    lines = content.splitlines(keepends=True)
+    headings = [
+        i
+        for i, line in enumerate(lines)
+        if line.startswith(b"### ") or line.startswith(b"## ")
+    ]
+    for pos, start in enumerate(headings):
+        header = lines[start]
+        if not header.startswith(b"### US-"):
+            continue
+        us_id_b, sep, rest = header[4:].partition(b":")
+        us_id = us_id_b.strip().decode("ascii")
+        if not sep or us_id not in wanted:
+            # Unmapped story: skip before any body field extraction.
+            continue
+        end = headings[pos + 1] if pos + 1 < len(headings) else len(lines)
+        body = b"".join(lines[start + 1:end]).decode("utf-8")
+        # One tokenizing scan over the body replaces a regex search per
+        # field; keys are normalized to lowercase without the colon.
+        fields: dict[str, str] = {}
+        for key, value in _BODY_FIELDS_RE.findall(body):
+            fields.setdefault(key.rstrip(":").lower(), value.strip())
+        priority = fields.get("priority", "P2").split()
+        stories.append(
+            {
+                "id": us_id,
+                "req_id": wanted[us_id],
+                "title": rest.decode("utf-8").strip(),
+                "priority": priority[0] if priority else "P2",
+                "as_a": " ".join(fields.get("as a", "").split()),
+                "want": " ".join(fields.get("i want", "").split()),
+                "so_that": " ".join(fields.get("so that", "").split()),
+                "acceptance": fields.get("acceptance criteria", ""),
+            }
+        )
+        if len(stories) == len(wanted):
+            # All mapped stories found; skip the rest of the spec.
+            break
+    return stories
+
+
+# Document templates, built once at module scope; per-document rendering
+# is a single format_map call.
+_REQ_TEMPLATE = """# {req_id}: {title}
+
+## Requirement
+
+{requirement}
+
+## Rationale
+
+{rationale}.
+
+## Parent Requirements
+
+- {parent_req}
+
+## Interfaces
+
+TBD
+
+## Allocated To
+
+TBD
+
+## Verification Method
+
+Test. Migrated acceptance criteria:
+
+{verification}
+## Notes
+
+Migrated from speckit user story {us_id} (priority {priority}).
+"""
+
+_INT_TEMPLATE = """# {int_id}: {title}
+
+## Type
+
+Internal
+
+## Specification
+
+### Overview
+
+{overview}
+
+### Details
+
+Migrated from speckit contract `{rel}`; see git history for the
+original contract text.
+
+## Constraints
+
+TBD
+
+## Referenced By
+
+TBD
+
+## Implemented By
+
+TBD
+
+## Used By
+
+TBD
+"""
+
+_EXT_INT_TEMPLATE = """# {int_id}: {title}
+
+## Type
+
+External Standard
+
+## External Specification
+
+- **Standard:** {standard}
+- **Reference:** TBD
+
+## Specification
+
+### Overview
+
+This project uses a subset of the {title} standard.
+
+### Usage
+
+{standard}.
+
+## Referenced By
+
+TBD
+
+## Implemented By
+
+TBD
+
+## Used By
+
+TBD
+"""
+
+_UNIT_TEMPLATE = """# {unit_id}: {title}
+
+## Purpose
+
+{purpose}
+
+## Implements Requirements
+
+TBD
+
+## Interfaces
+
+### Provides
+
+TBD
+
+### Consumes
+
+TBD
+
+## Design Description
+
+{design}
+
+## Implementation
+
+TBD
+
+## Design Notes
+
+Migrated from speckit module specification.
+"""
+
+
+def _split_criteria(acceptance: str) -> list[str]:
+    """Split an acceptance-criteria block into individual criteria.
+
+    Handles "-"/"*" bullets and numbered lists; continuation lines are
+    joined onto the preceding criterion. Pure line classification, so
+    plain string operations beat a regex split here.
+    """
+    criteria: list[str] = []
+    current: list[str] = []
+    for line in acceptance.splitlines():
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+        # A bullet marker is "-"/"*" or "N."/"N" followed by a space.
+        # Only that marker token is stripped, so markdown emphasis such
+        # as "**Given**" at the start of a criterion survives intact.
+        marker, sep, rest = stripped.partition(" ")
+        is_bullet = bool(sep) and (
+            not marker.lstrip("-*") or marker.rstrip(".").isdigit()
+        )
+        if is_bullet:
+            if current:
+                criteria.append(" ".join(current).strip())
+            current = [rest.lstrip()]
+        else:
+            # Continuation line, or prose before (or without) any bullet;
+            # keep it so bullet-less blocks still yield a criterion.
+            current.append(stripped)
+    if current:
+        criteria.append(" ".join(current).strip())
+    return [c for c in criteria if c]
+
+
+def generate_req_from_us(story: dict[str, str], parent_req: str) -> str:
+    """Render a REQ document from an extracted user story."""
+    criteria = _split_criteria(story["acceptance"])
+    verification = "".join(f"- {c}\n" for c in criteria) or "TBD\n"
+
+    return _REQ_TEMPLATE.format_map(
+        {
+            "req_id": story["req_id"],
+            "title": story["title"],
+            "requirement": (
+                f"When operating as {story['as_a'] or 'the system'}, "
+                f"the system SHALL {story['want'] or 'TBD'}."
+            ),
+            "rationale": (story["so_that"] or "TBD").rstrip("."),
+            "parent_req": parent_req,
+            "verification": verification,
+            "us_id": story["id"],
+            "priority": story["priority"],
+        }
+    )
+
+
+def generate_int_from_contract(
+    int_id: str, title: str, contract_path: Path
+) -> str:
+    """Render an INT document skeleton from a speckit contract file."""
+    contract = _slurp(contract_path)
+    return _INT_TEMPLATE.format_map(
+        {
+            "int_id": int_id,
+            "title": title,
+            "overview": extract_section(contract, "Overview") or "TBD",
+            "rel": os.fspath(contract_path).removeprefix(_ROOT_STR),
+        }
+    )
+
+
+def generate_external_int(int_id: str, title: str, standard: str) -> str:
+    """Render an INT document for an external standard."""
+    return _EXT_INT_TEMPLATE.format_map(
+        {"int_id": int_id, "title": title, "standard": standard}
+    )
+
+
+def generate_unit(unit_id: str, title: str, module_spec: str) -> str:
+    """Render a UNIT document skeleton from a legacy module specification."""
+    return _UNIT_TEMPLATE.format_map(
+        {
+            "unit_id": unit_id,
+            "title": title,
+            "purpose": extract_section(module_spec, "Purpose") or "TBD",
+            "design": extract_section(module_spec, "Design") or "TBD",
+        }
+    )
+
+
+def migrate_user_stories() -> Iterator[tuple[Path, str]]:
+    """Yield REQ documents from the mapped user stories of every feature."""
+    for feature_key, mapping in US_TO_REQ.items():
+        spec_file = SPECS_DIR / feature_key / "spec.md"
+        if not spec_file.exists():
+            continue
+        parent_req = f"REQ-{feature_key.split('-', 1)[0]}"
+        for story in extract_user_stories(spec_file, feature_key):
+            name = snake_case(story["title"])
+            num = story["req_id"].removeprefix("REQ-")
+            req_file = REQ_DIR / f"req_{num}_{name}.md"
+            if req_file.exists():
+                continue
+            yield req_file, generate_req_from_us(story, parent_req)
+
+
+def migrate_functional_requirements() -> Iterator[tuple[Path, str]]:
+    """Yield REQ stubs for FR entries that have no user-story mapping."""
+    # One directory read replaces a stat syscall per FR entry; newly
+    # yielded names are added so the snapshot stays coherent.
+    existing = set(os.listdir(REQ_DIR))
+    seen: set[str] = set()
+    for feature_key in US_TO_REQ:
+        spec_file = SPECS_DIR / feature_key / "spec.md"
+        if not spec_file.exists():
+            continue
+        content = _slurp(spec_file)
+        area = feature_key.split("-", 1)[0]
+        body = extract_section(content, "Functional Requirements")
+        for index, (fr_id, text) in enumerate(_FR_RE.findall(body), start=1):
+            title = text.split(".", 1)[0].strip()
+            if title in seen:
+                continue
+            seen.add(title)
+            num = f"{area}.{50 + index:02d}"
+            req_file = REQ_DIR / f"req_{num}_{snake_case(title)}.md"
+            if req_file.name in existing:
+                continue
+            existing.add(req_file.name)
+            yield req_file, (
+                f"# REQ-{num}: {title}\n\n## Requirement\n\n{text}\n\n"
+                f"## Rationale\n\nTBD\n\n## Parent Requirements\n\n"
+                f"- REQ-{area}\n\n## Interfaces\n\nTBD\n\n"
+                f"## Allocated To\n\nTBD\n\n## Notes\n\n"
+                f"Migrated from speckit {fr_id}.\n"
+            )
+
+
+def migrate_contracts() -> Iterator[tuple[Path, str]]:
+    """Yield INT documents from speckit contract files."""
+    for feature_dir in sorted(SPECS_DIR.iterdir()):
+        contracts_dir = feature_dir / "contracts"
+        if not contracts_dir.is_dir():
+            continue
+        for contract_path in sorted(contracts_dir.glob("*.md")):
+            mapping = CONTRACT_TO_INT.get(contract_path.stem)
+            if mapping is None:
+                continue
+            int_id, title = mapping
+            num = int_id.removeprefix("INT-")
+            int_file = INT_DIR / f"int_{num}_{snake_case(title)}.md"
+            if int_file.exists():
+                continue
+            yield int_file, generate_int_from_contract(
+                int_id, title, contract_path
+            )
+
+
+def create_external_interfaces() -> Iterator[tuple[Path, str]]:
+    """Yield INT documents for external standards used by the design."""
+    for int_id, title, standard in EXTERNAL_INTS:
+        num = int_id.removeprefix("INT-")
+        int_file = INT_DIR / f"int_{num}_{snake_case(title)}.md"
+        if int_file.exists():
+            continue
+        yield int_file, generate_external_int(int_id, title, standard)
+
+
+def migrate_modules() -> Iterator[tuple[Path, str]]:
+    """Yield UNIT documents from legacy module specifications."""
+    for feature_dir in sorted(SPECS_DIR.iterdir()):
+        modules_dir = feature_dir / "modules"
+        if not modules_dir.is_dir():
+            continue
+        for module_path in sorted(modules_dir.glob("*.md")):
+            mapping = MODULE_TO_UNIT.get(module_path.stem)
+            if mapping is None:
+                continue
+            unit_id, title = mapping
+            num = unit_id.removeprefix("UNIT-")
+            unit_file = UNIT_DIR / f"unit_{num}_{snake_case(title)}.md"
+            if unit_file.exists():
+                continue
+            yield unit_file, generate_unit(unit_id, title, _slurp(module_path))
+
+
+def extract_design_decisions() -> int:
+    """Append decision records from research.md files to design_decisions.md."""
+    adrs: list[str] = []
+    for feature_dir in sorted(SPECS_DIR.iterdir()):
+        research_file = feature_dir / "research.md"
+        if not research_file.exists():
+            continue
+        content = _slurp(research_file)
+        rel = os.fspath(research_file).removeprefix(_ROOT_STR)
+        for title, body in _DECISION_RE.findall(content):
+            adrs.append(
+                f"## {title.strip()}\n\n{body.strip()}\n\n"
+                f"(Migrated from `{rel}`.)\n"
+            )
+
+    if not adrs:
+        return 0
+    # The existing log is read only to skip already-migrated records;
+    # new records are streamed in append mode so each run costs
+    # O(new records), not a rewrite of the whole growing file.
+    if DESIGN_DECISIONS.exists():
+        existing = DESIGN_DECISIONS.read_text()
+    else:
+        DESIGN_DECISIONS.write_text("# Design Decisions\n\n")
+        existing = ""
+    new_adrs = [adr for adr in adrs if adr.splitlines()[0] not in existing]
+    if new_adrs:
+        with open(
+            DESIGN_DECISIONS, "a", encoding="utf-8", buffering=1 << 16
+        ) as f:
+            for adr in new_adrs:
+                f.write(adr + "\n")
+    return len(new_adrs)
+
+
+def _write_doc(item: tuple[Path, str]) -> None:
+    """Write one generated document; bytes mode skips newline translation."""
+    path, content = item
+    path.write_bytes(content.encode("utf-8"))
+
+
+def main() -> int:
+    """Run all migration stages and report what was created."""
+    if not SPECS_DIR.is_dir():
+        print(f"No legacy speckit tree at {SPECS_DIR}; nothing to migrate")
+        return 0
+
+    stages = [
+        ("user stories", migrate_user_stories),
+        ("functional requirements", migrate_functional_requirements),
+        ("contracts", migrate_contracts),
+        ("external interfaces", create_external_interfaces),
+        ("modules", migrate_modules),
+    ]
+    pending: list[tuple[Path, str]] = []
+    for label, stage in stages:
+        batch = list(stage())
+        pending.extend(batch)
+        print(f"  {label}: {len(batch)} created")
+    with ThreadPoolExecutor(max_workers=MAX_IO_WORKERS) as ex:
+        list(ex.map(_write_doc, pending))
+    print(f"  design decisions: {extract_design_decisions()} created")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Validate the syskit document corpus after a speckit migration.
+
+Checks the REQ/INT/UNIT documents under doc/ for structural problems
+introduced (or missed) by the migration: missing required sections,
+dangling cross-references, incomplete traceability, content that never
+made it out of the legacy specs, and leftover TBD placeholders. Each
+finding is reported with its document path; the exit code is non-zero
+when any check fails.
+"""
+
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+# Below this corpus size the process-pool startup cost outweighs the
+# parallel regex work; fall back to the sequential path.
+MIN_PARALLEL_DOCS = 32
+
+# Documents handed to each pool task; amortizes pickling overhead.
+POOL_CHUNK_SIZE = 16
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SPECS_DIR = ROOT_DIR / "specs"
+REQ_DIR = ROOT_DIR / "doc" / "requirements"
+INT_DIR = ROOT_DIR / "doc" / "interfaces"
+UNIT_DIR = ROOT_DIR / "doc" / "design"
+
+# Sections every migrated document must contain, by document kind.
+REQUIRED_SECTIONS: dict[str, list[str]] = {
+    "req": ["Requirement", "Rationale", "Parent Requirements"],
+    "int": ["Type", "Specification"],
+    "unit": ["Purpose", "Implements Requirements", "Interfaces"],
+}
+
+# Requirement IDs retired during migration clean-up; prose may still
+# mention them when explaining what superseded them.
+RETIRED_DOC_IDS: set[str] = {"REQ-028", "REQ-029"}
+
+# Compiled once at module scope: these run per document in the analysis
+# pass below.
+_DOC_ID_RE = re.compile(r"(req|int|unit)_([\d.]+)")
+_SECTION_HDR_RE = re.compile(r"^##\s+([^\n]+?)\s*$", re.MULTILINE)
+_SUBREQ_DEF_RE = re.compile(r"^###\s+((?:REQ|INT|UNIT)-[\d.]+):", re.MULTILINE)
+# Bytes pattern: spec files are counted without decoding them.
+_US_COUNT_RE = re.compile(rb"^###\s+US-\d+:", re.MULTILINE)
+_ANY_REF_RE = re.compile(r"\b(REQ|INT|UNIT)-([\d.]+)\b")
+
+
+@lru_cache(maxsize=256)
+def _slurp(path: Path) -> str:
+    """Read a document as one buffered binary read, memoized per path."""
+    with open(path, "rb", buffering=1 << 20) as f:
+        return f.read().decode("utf-8")
+
+
+@lru_cache(maxsize=8)
+def _list_docs(doc_dir_str: str, prefix: str) -> tuple[Path, ...]:
+    """List a document directory once via os.scandir, cached per directory."""
+    doc_dir = Path(doc_dir_str)
+    template = f"{prefix}_000_template"
+    out: list[Path] = []
+    for entry in os.scandir(doc_dir_str):
+        name = entry.name
+        if (
+            name.startswith(f"{prefix}_")
+            and name.endswith(".md")
+            and not name.startswith(template)
+            and entry.is_file()
+        ):
+            out.append(doc_dir / name)
+    return tuple(sorted(out))
+
+
+def find_all_docs(doc_dir: Path, prefix: str) -> tuple[Path, ...]:
+    """Return all non-template documents with the given prefix in a directory."""
+    return _list_docs(str(doc_dir), prefix)
+
+
+def extract_doc_id(doc_path: Path) -> str | None:
+    """Derive the document ID (e.g. "REQ-001.01") from a filename."""
+    m = _DOC_ID_RE.match(doc_path.name)
+    if m is None:
+        return None
+    return f"{m.group(1).upper()}-{m.group(2).rstrip('.')}"
+
+
+def check_tbd_presence(content: str) -> list[int]:
+    """Return the line numbers of TBD-only placeholder lines."""
+    return [
+        lineno
+        for lineno, line in enumerate(content.splitlines(), start=1)
+        if line.startswith("TBD") and line.rstrip() == "TBD"
+    ]
+
+
+def find_all_references(content: str) -> dict[str, set[str]]:
+    """Return every referenced document ID, grouped by kind, in one scan."""
+    found: dict[str, set[str]] = {"REQ": set(), "INT": set(), "UNIT": set()}
+    for kind, num in _ANY_REF_RE.findall(content):
+        found[kind].add(f"{kind}-{num}")
+    return found
+
+
+@dataclass
+class DocFacts:
+    """Everything the checks need from one document, built in one pass."""
+
+    path: Path
+
+    # "## " heading -> section body (text up to the next "## " heading).
+    sections: dict[str, str]
+
+    # Referenced document IDs, grouped by kind.
+    refs: dict[str, set[str]]
+
+    # Sub-clause IDs defined by "### REQ-NNN.n:" headings in this doc.
+    defined_ids: tuple[str, ...]
+
+    # Line numbers of TBD-only placeholder lines.
+    tbd_lines: list[int]
+
+
+def analyze_doc(path: Path, content: str) -> DocFacts:
+    """Extract sections, references, and TBD facts in one pass over a doc."""
+    headers = list(_SECTION_HDR_RE.finditer(content))
+    sections: dict[str, str] = {}
+    for i, m in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        sections[m.group(1)] = content[m.end():end]
+    return DocFacts(
+        path=path,
+        sections=sections,
+        refs=find_all_references(content),
+        defined_ids=tuple(_SUBREQ_DEF_RE.findall(content)),
+        tbd_lines=check_tbd_presence(content),
+    )
+
+
+def _analyze_one(item: tuple[str, str, str]) -> tuple[str, DocFacts]:
+    """Pool worker: analyze one document from (doc_id, path, content)."""
+    doc_id, path_str, content = item
+    return doc_id, analyze_doc(Path(path_str), content)
+
+
+# One entry per document: doc ID -> analyzed facts.
+Corpus = dict[str, DocFacts]
+
+
+def load_corpus() -> Corpus:
+    """Read and analyze every REQ/INT/UNIT document once.
+
+    The per-document analysis is pure CPU regex work, so large corpora
+    fan out over a process pool.
+    """
+    items: list[tuple[str, str, str]] = []
+    for doc_dir, prefix in (
+        (REQ_DIR, "req"),
+        (INT_DIR, "int"),
+        (UNIT_DIR, "unit"),
+    ):
+        for doc in find_all_docs(doc_dir, prefix):
+            doc_id = extract_doc_id(doc)
+            if doc_id is not None:
+                items.append((doc_id, str(doc), _slurp(doc)))
+
+    if len(items) < MIN_PARALLEL_DOCS:
+        return dict(map(_analyze_one, items))
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        return dict(ex.map(_analyze_one, items, chunksize=POOL_CHUNK_SIZE))
+
+
+def check_required_fields(corpus: Corpus) -> list[str]:
+    """Check that every document contains its kind's required sections."""
+    errors: list[str] = []
+    for doc_id, facts in corpus.items():
+        if "Status" in facts.sections:
+            # Withdrawn/removed documents keep only Status + Rationale.
+            continue
+        for section in REQUIRED_SECTIONS[doc_id.split("-", 1)[0].lower()]:
+            # Cheapest test first: presence is a dict lookup, the
+            # placeholder test a substring scan on the cached body.
+            body = facts.sections.get(section)
+            if body is None:
+                # Multi-clause requirements use the plural heading with
+                # "### REQ-NNN.n:" sub-clauses underneath.
+                if section == "Requirement":
+                    body = facts.sections.get("Requirements")
+                if body is None:
+                    errors.append(
+                        f"{facts.path.relative_to(ROOT_DIR)}: missing "
+                        f"section '## {section}'"
+                    )
+                    continue
+            if "TBD" in body:
+                errors.append(
+                    f"{facts.path.relative_to(ROOT_DIR)}: section "
+                    f"'## {section}' still contains TBD"
+                )
+    return errors
+
+
+def check_cross_reference_integrity(corpus: Corpus) -> list[str]:
+    """Check that every referenced document ID resolves to a real document."""
+    known: set[str] = set(corpus) | RETIRED_DOC_IDS
+    for facts in corpus.values():
+        known.update(facts.defined_ids)
+
+    errors: list[str] = []
+    for facts in corpus.values():
+        found = facts.refs
+        broken = (found["REQ"] | found["INT"] | found["UNIT"]) - known
+        for ref in sorted(broken):
+            # Template self-references (REQ-000 etc.) are not real docs.
+            if ref.endswith("-000"):
+                continue
+            errors.append(
+                f"{facts.path.relative_to(ROOT_DIR)}: dangling reference "
+                f"{ref}"
+            )
+    return errors
+
+
+def check_traceability_completeness(corpus: Corpus) -> list[str]:
+    """Check that every leaf requirement is allocated to at least one unit."""
+    allocated: set[str] = set()
+    for doc_id, facts in corpus.items():
+        if doc_id.startswith("UNIT-"):
+            allocated |= facts.refs["REQ"]
+
+    errors: list[str] = []
+    for doc_id, facts in corpus.items():
+        if not doc_id.startswith("REQ-") or "." not in doc_id:
+            continue
+        if doc_id not in allocated and "Allocated To" in facts.sections:
+            errors.append(
+                f"{facts.path.relative_to(ROOT_DIR)}: {doc_id} not "
+                f"referenced by any UNIT document"
+            )
+    return errors
+
+
+def check_content_migration(corpus: Corpus) -> list[str]:
+    """Check that every user story in the legacy specs reached a REQ doc."""
+    if not SPECS_DIR.is_dir():
+        return []
+    migrated = {doc_id for doc_id in corpus if doc_id.startswith("REQ-")}
+
+    errors: list[str] = []
+    for spec_file in sorted(SPECS_DIR.glob("*/spec.md")):
+        # Only a match count is needed; scan the raw bytes and skip the
+        # UTF-8 decode entirely.
+        us_count = len(_US_COUNT_RE.findall(spec_file.read_bytes()))
+        feature = spec_file.parent.name
+        area = feature.split("-", 1)[0]
+        area_reqs = sum(1 for r in migrated if r.startswith(f"REQ-{area}."))
+        if us_count > area_reqs:
+            errors.append(
+                f"{spec_file.relative_to(ROOT_DIR)}: {us_count} user "
+                f"stories but only {area_reqs} REQ-{area}.* documents"
+            )
+    return errors
+
+
+def check_remaining_tbds(corpus: Corpus) -> list[str]:
+    """Report documents that still contain TBD placeholder lines."""
+    warnings: list[str] = []
+    for facts in corpus.values():
+        if facts.tbd_lines:
+            warnings.append(
+                f"{facts.path.relative_to(ROOT_DIR)}: TBD on line(s) "
+                f"{', '.join(str(n) for n in facts.tbd_lines)}"
+            )
+    return warnings
+
+
+def main() -> int:
+    """Run all migration checks against one analyzed corpus snapshot."""
+    corpus = load_corpus()
+    checks = [
+        ("required fields", check_required_fields, True),
+        ("cross-reference integrity", check_cross_reference_integrity, True),
+        ("traceability completeness", check_traceability_completeness, True),
+        ("content migration", check_content_migration, True),
+        ("remaining TBDs", check_remaining_tbds, False),
+    ]
+    # The checks are independent and share the read-only corpus; run
+    # them concurrently and report in the declared order.
+    with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+        futures = [ex.submit(check, corpus) for _, check, _ in checks]
+        results = [future.result() for future in futures]
+
+    failed = False
+    for (label, _, fatal), findings in zip(checks, results):
+        status = "OK" if not findings else f"{len(findings)} finding(s)"
+        print(f"  {label}: {status}")
+        for finding in findings:
+            print(f"    {finding}")
+        if findings and fatal:
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())